@@ -1,12 +1,12 @@
-from typing import Dict, Any, Union
-from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, Request
+from fastapi.responses import Response, HTMLResponse
 from fastapi.templating import Jinja2Templates
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
-import uvicorn
+import orjson
 import time
-from config import get_settings
+from config import get_settings, get_loop_implementation, get_http_implementation
 
 # Initialize Jinja2 templates
 templates = Jinja2Templates(directory="templates")
@@ -14,37 +14,99 @@ templates = Jinja2Templates(directory="templates")
 # Load application settings
 settings = get_settings()
 
+# Pre-render the hello world page once; its content never changes per request
+_HELLO_HTML: bytes = templates.get_template("hello.html").render(message="Hello World").encode("utf-8")
+
+# Pre-encode the static part of the health payload; only the trailing
+# timestamp is filled in per request
+_HEALTH_PREFIX: bytes = orjson.dumps({
+    "status": "healthy",
+    "message": "Hello World Web Application is running",
+    "app_name": settings.app_name,
+    "app_version": settings.app_version,
+    "timestamp": 0.0
+})[:-len(b"0.0}")]
+_HEALTH_SUFFIX: bytes = b"}"
+
+# Error pages; the 404 and 500 bodies are fully static
+_NOT_FOUND_HTML: bytes = b"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Page Not Found</title>
+    </head>
+    <body>
+        <h1>404 - Page Not Found</h1>
+        <p>The requested page could not be found.</p>
+    </body>
+    </html>
+    """
 
-class HealthResponse(BaseModel):
-    """Response model for health check endpoint."""
-    status: str
-    message: str
-    timestamp: float
-    app_name: str
-    app_version: str
+_INTERNAL_SERVER_ERROR_HTML: bytes = b"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Internal Server Error</title>
+    </head>
+    <body>
+        <h1>500 - Internal Server Error</h1>
+        <p>An internal server error occurred.</p>
+    </body>
+    </html>
+    """
+
+_ERROR_TEMPLATE: str = """
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Error {code}</title>
+    </head>
+    <body>
+        <h1>Error {code}</h1>
+        <p>{detail}</p>
+    </body>
+    </html>
+    """
 
 
 def create_app() -> FastAPI:
     """
     Application factory function that creates and configures the FastAPI application.
     
+    The interactive docs and OpenAPI schema routes are only registered in
+    debug mode.
+    
     Returns:
         FastAPI: Configured FastAPI application instance
     """
+    settings = get_settings()
+    
     app = FastAPI(
         title="Hello World Web Application",
         description="A simple web application that displays Hello World",
-        version="1.0.0"
+        version="1.0.0",
+        docs_url="/docs" if settings.debug else None,
+        redoc_url="/redoc" if settings.debug else None,
+        openapi_url="/openapi.json" if settings.debug else None
     )
     
-    # Add exception handlers
-    app.add_exception_handler(HTTPException, http_exception_handler)
-    app.add_exception_handler(404, not_found_handler)
-    app.add_exception_handler(500, internal_server_error_handler)
+    # Compress responses large enough to benefit from gzip
+    app.add_middleware(GZipMiddleware, minimum_size=500)
     
-    # Add routes
-    app.add_api_route("/", get_hello_page, methods=["GET"], response_class=HTMLResponse, response_model=None)
-    app.get("/health", response_model=HealthResponse)(get_health_check)
+    # Add exception handlers. Starlette's HTTPException is the base of FastAPI's
+    # and is also raised for unmatched routes, so one handler covers every
+    # HTTP error and dispatches on status code.
+    app.exception_handler(StarletteHTTPException)(http_exception_handler)
+    app.exception_handler(Exception)(internal_server_error_handler)
+    
+    # Add routes as plain Starlette routes; the handlers take only the
+    # Request, so no FastAPI dependency graph is solved per request
+    app.add_route("/", get_hello_page, methods=["GET"])
+    app.add_route("/health", get_health_check, methods=["GET"])
+    
+    # Serve static assets through Starlette's FileResponse, which uses
+    # sendfile(2) when available
+    app.mount("/static", StaticFiles(directory=settings.static_dir), name="static")
     
     return app
 
@@ -53,20 +115,19 @@ async def get_hello_page(request: Request) -> HTMLResponse:
     """
     Route handler for the hello world page.
     
+    Serves the hello.html template pre-rendered at import time, so no
+    Jinja2 rendering happens per request.
+    
     Args:
-        request: FastAPI Request object
+        request: Starlette Request object
         
     Returns:
         HTMLResponse: Rendered HTML template with Hello World message
     """
-    context: Dict[str, Any] = {
-        "request": request,
-        "message": "Hello World"
-    }
-    return templates.TemplateResponse("hello.html", context)
+    return HTMLResponse(content=_HELLO_HTML)
 
 
-async def get_health_check() -> HealthResponse:
+async def get_health_check(request: Request) -> Response:
     """
     Health check endpoint that returns application status and basic information.
     
@@ -76,68 +137,58 @@ async def get_health_check() -> HealthResponse:
     - Application name and version from configuration
     - Responds within performance requirements (< 1 second)
     
+    The static fields are encoded once at import time; only the timestamp
+    is formatted per request, from the integer nanosecond clock so no float
+    conversion or float formatting is involved.
+    
+    Args:
+        request: Starlette Request object
+        
     Returns:
-        HealthResponse: Typed response with application health information
-    """
-    return HealthResponse(
-        status="healthy",
-        message="Hello World Web Application is running",
-        timestamp=time.time(),
-        app_name=settings.app_name,
-        app_version=settings.app_version
+        Response: JSON response with application health information
+    """
+    seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    return Response(
+        content=_HEALTH_PREFIX + b"%d.%06d" % (seconds, nanoseconds // 1000) + _HEALTH_SUFFIX,
+        media_type="application/json"
     )
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> HTMLResponse:
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> HTMLResponse:
     """
     Custom HTTP exception handler with typed response.
     
+    404 and 500 errors are rendered by their dedicated handlers; any other
+    status code gets a generic error page.
+    
     Args:
         request: FastAPI Request object
-        exc: HTTPException instance
+        exc: Starlette HTTPException instance
         
     Returns:
         HTMLResponse: Formatted error page
     """
-    error_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Error {exc.status_code}</title>
-    </head>
-    <body>
-        <h1>Error {exc.status_code}</h1>
-        <p>{exc.detail}</p>
-    </body>
-    </html>
-    """
+    if exc.status_code == 404:
+        return await not_found_handler(request, exc)
+    if exc.status_code == 500:
+        return await internal_server_error_handler(request, exc)
+    
+    error_content = _ERROR_TEMPLATE.format(code=exc.status_code, detail=exc.detail)
     return HTMLResponse(content=error_content, status_code=exc.status_code)
 
 
-async def not_found_handler(request: Request, exc: HTTPException) -> HTMLResponse:
+async def not_found_handler(request: Request, exc: StarletteHTTPException) -> HTMLResponse:
     """
     Custom 404 error handler.
     
     Args:
         request: FastAPI Request object
-        exc: HTTPException instance
+        exc: Starlette HTTPException instance
         
     Returns:
         HTMLResponse: 404 error page
     """
-    error_content = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Page Not Found</title>
-    </head>
-    <body>
-        <h1>404 - Page Not Found</h1>
-        <p>The requested page could not be found.</p>
-    </body>
-    </html>
-    """
-    return HTMLResponse(content=error_content, status_code=404)
+    return HTMLResponse(content=_NOT_FOUND_HTML, status_code=404)
 
 
 async def internal_server_error_handler(request: Request, exc: Exception) -> HTMLResponse:
@@ -151,19 +202,7 @@ async def internal_server_error_handler(request: Request, exc: Exception) -> HTM
     Returns:
         HTMLResponse: 500 error page
     """
-    error_content = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Internal Server Error</title>
-    </head>
-    <body>
-        <h1>500 - Internal Server Error</h1>
-        <p>An internal server error occurred.</p>
-    </body>
-    </html>
-    """
-    return HTMLResponse(content=error_content, status_code=500)
+    return HTMLResponse(content=_INTERNAL_SERVER_ERROR_HTML, status_code=500)
 
 
 # Create the application instance
@@ -174,12 +213,18 @@ def main() -> None:
     """
     Application startup function for development.
     """
+    # Imported here so ASGI workers loading app:app don't pay for it
+    import uvicorn
+    
     uvicorn.run(
         "app:app",
         host="127.0.0.1",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info" if settings.debug else "warning",
+        access_log=settings.debug,
+        loop=get_loop_implementation(),
+        http=get_http_implementation()
     )
 
 
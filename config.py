@@ -4,7 +4,9 @@ This module provides typed configuration settings using Pydantic Settings
 with support for environment variables and .env file loading.
 """
 
-from typing import Optional
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Literal, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -42,6 +44,31 @@ class Settings(BaseSettings):
         description="Enable debug mode for development"
     )
     
+    workers: int = Field(
+        default=1,
+        ge=1,
+        description="Number of worker processes (ignored in debug mode)"
+    )
+    
+    # Connection tuning
+    backlog: int = Field(
+        default=4096,
+        ge=1,
+        description="Maximum number of pending connections in the listen queue"
+    )
+    
+    timeout_keep_alive: int = Field(
+        default=15,
+        ge=0,
+        description="Seconds to keep idle keep-alive connections open"
+    )
+    
+    limit_concurrency: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum concurrent connections before responding with 503"
+    )
+    
     # Application configuration
     app_name: str = Field(
         default="Hello World Web App",
@@ -58,16 +85,45 @@ class Settings(BaseSettings):
         default="templates",
         description="Directory containing HTML templates"
     )
+    
+    # Static assets configuration
+    static_dir: str = Field(
+        default="static",
+        description="Directory containing static assets served under /static"
+    )
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get application settings instance.
     
+    Settings are built once and cached; call ``get_settings.cache_clear()``
+    to reload them after changing the environment.
+    
     Returns:
         Settings: Configured settings instance with environment variables loaded.
     """
     return Settings()
 
 
+def get_loop_implementation() -> Literal["uvloop", "auto"]:
+    """Get the event loop implementation to run uvicorn with.
+    
+    Returns:
+        Literal["uvloop", "auto"]: "uvloop" when installed, otherwise "auto"
+        (e.g. on Windows where uvloop is unavailable).
+    """
+    return "uvloop" if find_spec("uvloop") is not None else "auto"
+
+
+def get_http_implementation() -> Literal["httptools", "auto"]:
+    """Get the HTTP protocol implementation to run uvicorn with.
+    
+    Returns:
+        Literal["httptools", "auto"]: "httptools" when installed, otherwise "auto".
+    """
+    return "httptools" if find_spec("httptools") is not None else "auto"
+
+
 # Global settings instance
 settings = get_settings()
\ No newline at end of file
@@ -6,25 +6,31 @@ startup confirmation messages, and error handling for development use.
 """
 
 import sys
-import signal
 import logging
 from typing import NoReturn, Optional
-import uvicorn
-from config import get_settings
+from config import get_settings, get_loop_implementation, get_http_implementation
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S"
-)
-
 logger = logging.getLogger(__name__)
 
 
+def configure_logging() -> None:
+    """Configure root logging for the development server.
+    
+    Called from run_server() rather than at import time, so importing this
+    module does not reconfigure the root logger.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+
+
 def setup_signal_handlers() -> None:
     """Set up signal handlers for graceful shutdown."""
+    import signal
+    
     def signal_handler(signum: int, frame: Optional[object]) -> NoReturn:
         """Handle shutdown signals gracefully."""
         logger.info(f"Received signal {signum}. Shutting down gracefully...")
@@ -46,6 +52,12 @@ def run_server() -> None:
     Raises:
         SystemExit: If server fails to start or encounters critical errors
     """
+    # Imported here so importing this module stays cheap
+    import uvicorn
+    from uvicorn.supervisors import Multiprocess
+    
+    configure_logging()
+    
     try:
         # Load application settings
         settings = get_settings()
@@ -59,18 +71,26 @@ def run_server() -> None:
         logger.info("=" * 50)
         logger.info(f"Application: {settings.app_name} v{settings.app_version}")
         logger.info(f"Debug mode: {settings.debug}")
+        if not settings.debug:
+            logger.info(f"Workers: {settings.workers}")
         logger.info(f"Server starting on: http://{settings.host}:{settings.port}")
         logger.info("Press CTRL+C to stop the server")
         logger.info("=" * 50)
         
-        # Configure uvicorn server
+        # Configure uvicorn server (reload and multiple workers are mutually exclusive)
         config = uvicorn.Config(
             app="app:app",
             host=settings.host,
             port=settings.port,
             reload=settings.debug,
+            workers=1 if settings.debug else settings.workers,
+            backlog=settings.backlog,
+            timeout_keep_alive=settings.timeout_keep_alive,
+            limit_concurrency=settings.limit_concurrency,
             log_level="info" if settings.debug else "warning",
             access_log=settings.debug,
+            loop=get_loop_implementation(),
+            http=get_http_implementation(),
             reload_dirs=[".", "templates"] if settings.debug else None,
             reload_excludes=["*.pyc", "__pycache__", ".git", ".pytest_cache"] if settings.debug else None
         )
@@ -83,7 +103,11 @@ def run_server() -> None:
         logger.info(f"Visit http://{settings.host}:{settings.port} to view the application")
         
         # Run the server (this blocks until shutdown)
-        server.run()
+        if config.workers > 1:
+            sock = config.bind_socket()
+            Multiprocess(config, target=server.run, sockets=[sock]).run()
+        else:
+            server.run()
         
     except KeyboardInterrupt:
         logger.info("Server shutdown requested by user")
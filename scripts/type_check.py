@@ -5,10 +5,10 @@ This script runs mypy type checking on all Python files in the project
 and provides clear feedback on type checking results.
 """
 
-import subprocess
 import sys
+from contextlib import chdir
 from pathlib import Path
-from typing import List, Tuple
+from typing import Tuple
 
 
 def run_mypy_check() -> Tuple[bool, str]:
@@ -19,18 +19,19 @@ def run_mypy_check() -> Tuple[bool, str]:
         Tuple[bool, str]: (success, output) where success indicates if type checking passed
     """
     try:
-        # Run mypy on the main application files
-        result = subprocess.run(
-            ["mypy", "app.py", "config.py", "run.py", "tests/"],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent
-        )
+        from mypy import api as mypy_api
+    except ImportError:
+        return False, "mypy not found. Please install mypy: pip install mypy"
+    
+    try:
+        # Run mypy in-process on the main application files
+        with chdir(Path(__file__).parent.parent):
+            stdout, stderr, exit_status = mypy_api.run(
+                ["app.py", "config.py", "run.py", "tests/"]
+            )
         
-        return result.returncode == 0, result.stdout + result.stderr
+        return exit_status == 0, stdout + stderr
         
-    except FileNotFoundError:
-        return False, "mypy not found. Please install mypy: pip install mypy"
     except Exception as e:
         return False, f"Error running mypy: {e}"
 
@@ -0,0 +1,34 @@
+"""Shared pytest fixtures for the Hello World Web Application test suite."""
+
+import pytest
+from fastapi.testclient import TestClient
+from app import create_app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a test client shared by the whole test session.
+    
+    Tests only issue read-only requests, so one application instance serves
+    them all. Entering the client runs startup/shutdown once and keeps one
+    asyncio event loop portal and one connection pool for every request.
+    """
+    with TestClient(create_app(), backend="asyncio") as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def hello_response(client):
+    """Fetch the hello world page once for content-only assertions.
+    
+    The page is pre-rendered and identical on every request, so tests that
+    only inspect its content share this response. Tests that measure the
+    round-trip issue their own requests.
+    """
+    return client.get("/")
+
+
+@pytest.fixture(scope="session")
+def index_html(hello_response):
+    """Raw body bytes of the shared hello world page response."""
+    return hello_response.content
@@ -4,19 +4,14 @@ Tests route handlers, response content, status codes, and core functionality
 using FastAPI TestClient as specified in requirements 1.1, 1.2, and 3.1.
 """
 
-import pytest
-from fastapi.testclient import TestClient
-from app import create_app, HealthResponse
+from unittest.mock import patch
+from fastapi.routing import APIRoute
+from starlette.routing import Route
+from app import create_app
+from config import Settings, get_settings
 import time
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI application."""
-    app = create_app()
-    return TestClient(app)
-
-
 class TestHelloWorldRoute:
     """Test cases for the hello world route handler."""
     
@@ -35,6 +30,12 @@ class TestHelloWorldRoute:
         response = client.get("/")
         assert "Hello World" in response.text
     
+    def test_get_hello_page_is_gzip_compressed(self, client):
+        """Test that the hello page is gzip-compressed when the client accepts it."""
+        response = client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Hello World" in response.text
+    
     def test_get_hello_page_response_time(self, client):
         """Test that the hello page responds within 1 second (requirement 3.1)."""
         start_time = time.time()
@@ -72,6 +73,19 @@ class TestHealthCheckRoute:
         assert data["status"] == "healthy"
         assert isinstance(data["timestamp"], float)
     
+    def test_health_check_reports_configured_app(self, client):
+        """Test that the pre-encoded health payload carries the configured app info."""
+        data = client.get("/health").json()
+        settings = get_settings()
+        
+        assert data["app_name"] == settings.app_name
+        assert data["app_version"] == settings.app_version
+    
+    def test_health_check_is_not_compressed(self, client):
+        """Test that health check payloads below the gzip threshold are sent as-is."""
+        response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+    
     def test_health_check_response_time(self, client):
         """Test that health check responds within 1 second (requirement 3.1)."""
         start_time = time.time()
@@ -96,6 +110,13 @@ class TestErrorHandling:
         """Test that 404 error returns HTML content."""
         response = client.get("/nonexistent-page")
         assert response.headers["content-type"] == "text/html; charset=utf-8"
+    
+    def test_other_http_errors_use_generic_handler(self, client):
+        """Test that non-404 HTTP errors render the generic error page."""
+        response = client.post("/health")
+        assert response.status_code == 405
+        assert "Error 405" in response.text
+        assert response.headers["content-type"] == "text/html; charset=utf-8"
 
 
 class TestApplicationFactory:
@@ -111,4 +132,34 @@ class TestApplicationFactory:
         """Test that the created app has correct title and version."""
         app = create_app()
         assert app.title == "Hello World Web Application"
-        assert app.version == "1.0.0"
\ No newline at end of file
+        assert app.version == "1.0.0"
+    
+    def test_create_app_mounts_static_files(self):
+        """Test that static assets are mounted under /static."""
+        app = create_app()
+        assert app.url_path_for("static", path="style.css") == "/static/style.css"
+    
+    def test_create_app_exposes_docs_in_debug(self):
+        """Test that documentation routes are registered in debug mode."""
+        with patch("app.get_settings", return_value=Settings(debug=True)):
+            app = create_app()
+        
+        paths = {getattr(route, "path", None) for route in app.routes}
+        assert {"/docs", "/redoc", "/openapi.json"} <= paths
+    
+    def test_create_app_hides_docs_in_production(self):
+        """Test that documentation routes are not registered outside debug mode."""
+        with patch("app.get_settings", return_value=Settings(debug=False)):
+            app = create_app()
+        
+        paths = {getattr(route, "path", None) for route in app.routes}
+        assert not {"/docs", "/redoc", "/openapi.json"} & paths
+    
+    def test_create_app_registers_plain_starlette_routes(self):
+        """Test that routes bypass FastAPI dependency resolution and response models."""
+        app = create_app()
+        routes = {getattr(route, "path", None): route for route in app.routes}
+        
+        for path in ("/", "/health"):
+            assert isinstance(routes[path], Route)
+            assert not isinstance(routes[path], APIRoute)
\ No newline at end of file
@@ -7,7 +7,15 @@ as specified in requirements 1.1, 1.2, and 3.1.
 import pytest
 import os
 from unittest.mock import patch
-from config import Settings, get_settings
+from config import Settings, get_settings, get_loop_implementation, get_http_implementation
+
+
+@pytest.fixture
+def clear_settings_cache():
+    """Clear the cached settings before and after a test that changes the environment."""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
 
 
 class TestSettingsModel:
@@ -20,9 +28,14 @@ class TestSettingsModel:
         assert settings.host == "127.0.0.1"
         assert settings.port == 8000
         assert settings.debug is True
+        assert settings.workers == 1
+        assert settings.backlog == 4096
+        assert settings.timeout_keep_alive == 15
+        assert settings.limit_concurrency is None
         assert settings.app_name == "Hello World Web App"
         assert settings.app_version == "0.1.0"
         assert settings.templates_dir == "templates"
+        assert settings.static_dir == "static"
     
     def test_settings_with_custom_values(self):
         """Test that settings can be initialized with custom values."""
@@ -64,6 +77,21 @@ class TestSettingsModel:
         
         with pytest.raises(ValueError):
             Settings(port=-1)
+    
+    def test_workers_validation(self):
+        """Test that worker count must be at least one."""
+        assert Settings(workers=4).workers == 4
+        
+        with pytest.raises(ValueError):
+            Settings(workers=0)
+    
+    def test_connection_tuning_validation(self):
+        """Test that connection tuning limits reject non-positive values."""
+        with pytest.raises(ValueError):
+            Settings(backlog=0)
+        
+        with pytest.raises(ValueError):
+            Settings(limit_concurrency=0)
 
 
 class TestEnvironmentVariables:
@@ -117,7 +145,7 @@ class TestGetSettingsFunction:
         settings = get_settings()
         assert isinstance(settings, Settings)
     
-    def test_get_settings_loads_environment(self):
+    def test_get_settings_loads_environment(self, clear_settings_cache):
         """Test that get_settings loads environment variables."""
         with patch.dict(os.environ, {
             'HELLO_HOST': '127.0.0.2',
@@ -127,6 +155,10 @@ class TestGetSettingsFunction:
             
             assert settings.host == "127.0.0.2"
             assert settings.port == 8001
+    
+    def test_get_settings_is_cached(self):
+        """Test that get_settings returns the same cached instance."""
+        assert get_settings() is get_settings()
 
 
 class TestSettingsValidation:
@@ -163,4 +195,20 @@ class TestSettingsValidation:
         }):
             settings = Settings()
             assert settings.host == "localhost"
-            assert settings.app_name == "My Test App"
\ No newline at end of file
+            assert settings.app_name == "My Test App"
+
+
+class TestServerImplementations:
+    """Test cases for uvicorn loop and HTTP implementation selection."""
+    
+    def test_uses_uvloop_and_httptools_when_available(self):
+        """Test that uvloop and httptools are selected when installed."""
+        with patch("config.find_spec", return_value=object()):
+            assert get_loop_implementation() == "uvloop"
+            assert get_http_implementation() == "httptools"
+    
+    def test_falls_back_to_auto_when_unavailable(self):
+        """Test that "auto" is selected when uvloop/httptools are missing."""
+        with patch("config.find_spec", return_value=None):
+            assert get_loop_implementation() == "auto"
+            assert get_http_implementation() == "auto"
\ No newline at end of file
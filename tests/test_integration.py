@@ -4,43 +4,42 @@ Tests end-to-end HTTP request/response flow, template rendering, error handling,
 and server startup/shutdown processes as specified in requirements 2.1, 2.3, 3.1, and 3.3.
 """
 
+import array
+import asyncio
+import httpx
 import pytest
+import re
 import time
-import threading
-from typing import Generator
-from fastapi.testclient import TestClient
 from app import create_app
-import uvicorn
 from config import get_settings
 
 
-@pytest.fixture
-def client():
-    """Create a test client for integration testing."""
-    app = create_app()
-    return TestClient(app)
+# Expected structure of the hello world page, in document order
+_HELLO_RE = re.compile(
+    rb"<!DOCTYPE html>.*<html.*<head>.*</head>.*<body>.*Hello World.*</body>.*</html>",
+    re.DOTALL
+)
+
+
+def _assert_html(response: httpx.Response, status_code: int = 200) -> None:
+    """Assert that a response has the given status and is served as UTF-8 HTML."""
+    assert response.status_code == status_code
+    assert response.headers.get("content-type") == "text/html; charset=utf-8"
 
 
 class TestEndToEndFlow:
     """Test cases for end-to-end HTTP request/response flow."""
     
-    def test_complete_hello_world_flow(self, client):
+    def test_complete_hello_world_flow(self, hello_response):
         """Test complete flow from request to rendered HTML response."""
-        # Make request to hello world page
-        response = client.get("/")
+        # Use the hello world page response fetched once for the session
+        response = hello_response
         
         # Verify response status and headers
-        assert response.status_code == 200
-        assert response.headers["content-type"] == "text/html; charset=utf-8"
+        _assert_html(response)
         
-        # Verify HTML structure and content
-        html_content = response.text
-        assert "<!DOCTYPE html>" in html_content
-        assert "<html" in html_content
-        assert "<head>" in html_content
-        assert "<body>" in html_content
-        assert "Hello World" in html_content
-        assert "</html>" in html_content
+        # Verify HTML structure and content in a single scan of the body
+        assert _HELLO_RE.search(response.content)
     
     def test_health_check_integration(self, client):
         """Test complete health check endpoint integration."""
@@ -62,98 +61,72 @@ class TestEndToEndFlow:
         assert isinstance(data["timestamp"], float)
         assert data["timestamp"] > 0
     
-    def test_concurrent_requests_handling(self, client):
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_handling(self):
         """Test that the application handles multiple concurrent requests (requirement 3.4)."""
-        import concurrent.futures
-        
-        def make_request():
-            response = client.get("/")
-            return response.status_code, "Hello World" in response.text
+        transport = httpx.ASGITransport(app=create_app())  # type: ignore[arg-type]
         
-        # Make 10 concurrent requests
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(make_request) for _ in range(10)]
-            results = [future.result() for future in concurrent.futures.as_completed(futures)]
+        # Make 10 concurrent requests on the event loop
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+            responses = await asyncio.gather(*[async_client.get("/") for _ in range(10)])
         
         # Verify all requests succeeded
-        for status_code, has_hello_world in results:
-            assert status_code == 200
-            assert has_hello_world is True
+        for response in responses:
+            assert response.status_code == 200
+            assert "Hello World" in response.text
 
 
 class TestTemplateRendering:
     """Test cases for template rendering integration."""
     
-    def test_template_rendering_with_context(self, client):
-        """Test that templates are rendered with proper context variables."""
-        response = client.get("/")
-        
-        # Verify template was rendered successfully
-        assert response.status_code == 200
-        html_content = response.text
-        
-        # Check that template variables were properly substituted
-        assert "Hello World" in html_content
+    def test_template_rendering_with_context(self, index_html):
+        """Test that the template file was loaded and rendered into one complete document."""
+        # Template should have substantial content (not a fallback response)
+        assert len(index_html) > 50
         
         # Verify HTML structure is complete
-        assert html_content.count("<html") == 1
-        assert html_content.count("</html>") == 1
-        assert html_content.count("<head>") == 1
-        assert html_content.count("</head>") == 1
-        assert html_content.count("<body>") == 1
-        assert html_content.count("</body>") == 1
-    
-    def test_template_file_loading(self, client):
-        """Test that template files are properly loaded from templates directory."""
-        response = client.get("/")
-        
-        # Verify response indicates successful template loading
-        assert response.status_code == 200
-        
-        # Verify content suggests template was loaded (not a fallback response)
-        html_content = response.text
-        assert len(html_content) > 50  # Template should have substantial content
-        assert "Hello World" in html_content
+        assert index_html.count(b"<html") == 1
+        assert index_html.count(b"</html>") == 1
+        assert index_html.count(b"<head>") == 1
+        assert index_html.count(b"</head>") == 1
+        assert index_html.count(b"<body>") == 1
+        assert index_html.count(b"</body>") == 1
 
 
 class TestErrorHandlingIntegration:
     """Test cases for error handling integration."""
     
-    def test_404_error_handling_integration(self, client):
+    @pytest.mark.parametrize("path", ["/nonexistent", "/missing-page", "/404-test", "/random/path"])
+    def test_404_error_handling_integration(self, client, path):
         """Test complete 404 error handling flow (requirement 3.3)."""
-        # Test various non-existent paths
-        test_paths = ["/nonexistent", "/missing-page", "/404-test", "/random/path"]
+        response = client.get(path)
         
-        for path in test_paths:
-            response = client.get(path)
-            
-            # Verify 404 response
-            assert response.status_code == 404
-            assert response.headers["content-type"] == "text/html; charset=utf-8"
-            
-            # Verify error page content
-            html_content = response.text
-            assert "404" in html_content
-            assert "Page Not Found" in html_content or "Not Found" in html_content
-            
-            # Verify it's proper HTML
-            assert "<!DOCTYPE html>" in html_content
-            assert "<html>" in html_content
-            assert "</html>" in html_content
+        # Verify 404 response
+        _assert_html(response, status_code=404)
+        
+        # Verify error page content
+        html_content = response.text
+        assert "404" in html_content
+        assert "Page Not Found" in html_content or "Not Found" in html_content
+        
+        # Verify it's proper HTML
+        assert "<!DOCTYPE html>" in html_content
+        assert "<html>" in html_content
+        assert "</html>" in html_content
     
     def test_error_response_format_consistency(self, client):
         """Test that error responses maintain consistent HTML format."""
         response = client.get("/nonexistent-endpoint")
         
         assert response.status_code == 404
-        html_content = response.text
+        html_content = response.content
         
         # Verify HTML structure
-        assert html_content.startswith("<!DOCTYPE html>") or "<html>" in html_content
-        assert "<head>" in html_content
-        assert "<title>" in html_content
-        assert "<body>" in html_content
-        assert "</html>" in html_content
+        assert html_content.startswith(b"<!DOCTYPE html>") or b"<html>" in html_content
+        assert b"<head>" in html_content
+        assert b"<title>" in html_content
+        assert b"<body>" in html_content
+        assert b"</html>" in html_content
 
 
 class TestPerformanceIntegration:
@@ -161,42 +134,40 @@ class TestPerformanceIntegration:
     
     def test_response_time_under_load(self, client):
         """Test response times under multiple requests (requirement 3.1)."""
-        response_times = []
+        request_count = 20
+        response_times_ns = array.array("q", [0] * request_count)
+        total_ns = 0
         
         # Make 20 requests and measure response times
-        for _ in range(20):
-            start_time = time.time()
+        for i in range(request_count):
+            start = time.perf_counter_ns()
             response = client.get("/")
-            end_time = time.time()
+            elapsed_ns = time.perf_counter_ns() - start
             
-            response_time = end_time - start_time
-            response_times.append(response_time)
+            response_times_ns[i] = elapsed_ns
+            total_ns += elapsed_ns
             
             # Verify successful response
             assert response.status_code == 200
         
         # Verify all responses were under 1 second
-        for response_time in response_times:
-            assert response_time < 1.0
+        assert max(response_times_ns) < 1_000_000_000
         
         # Verify average response time is reasonable
-        avg_response_time = sum(response_times) / len(response_times)
-        assert avg_response_time < 0.5  # Should be much faster than 1 second
+        assert total_ns // request_count < 500_000_000  # Should be much faster than 1 second
     
     def test_health_check_performance(self, client):
         """Test health check endpoint performance."""
-        start_time = time.time()
+        start = time.perf_counter_ns()
         response = client.get("/health")
-        end_time = time.time()
-        
-        response_time = end_time - start_time
+        elapsed_ns = time.perf_counter_ns() - start
         
         # Verify response and performance
         assert response.status_code == 200
-        assert response_time < 1.0
+        assert elapsed_ns < 1_000_000_000
         
         # Health check should be very fast
-        assert response_time < 0.1
+        assert elapsed_ns < 100_000_000
 
 
 class TestApplicationLifecycle:
@@ -212,10 +183,7 @@ class TestApplicationLifecycle:
         assert app.version == "1.0.0"
         
         # Verify routes are registered
-        route_paths = []
-        for route in app.routes:
-            if hasattr(route, 'path'):
-                route_paths.append(route.path)
+        route_paths = {getattr(route, "path", None) for route in app.routes}
         assert "/" in route_paths
         assert "/health" in route_paths
     